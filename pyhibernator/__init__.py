@@ -4,8 +4,10 @@ from pyhibernator.main import AdjustedGiniCoefficient, \
     BeautyCoefficientCumulativePercentage, \
     CitationAngle, \
     CitationDelay, \
+    CitationHistory, \
     DNIC, \
     ExponentialQuartile, \
     KValue, \
     Naive, \
-    Quartile
+    Quartile, \
+    build_citation_matrix
@@ -1,12 +1,174 @@
 from __future__ import annotations
 
-import itertools 
+import functools
+from collections import defaultdict
 
 import numpy as np
-import pandas as pd
 
+try:
+    from numba import njit
+except ImportError: #numba is optional; without it the kernels run as pure Python
+    def njit(*args, **kwargs):
+        return lambda func: func
 
-class AdjustedGiniCoefficient: 
+
+@functools.lru_cache(maxsize=4096)
+def _arange(n:int) -> np.ndarray:
+    """
+    Cached read-only np.arange(n), shared across repeated score calls
+    """
+    a = np.arange(n, dtype=np.int64)
+    a.setflags(write=False)
+    return a
+
+
+def build_citation_matrix(c_list:list[list[int]]) -> (np.ndarray, np.ndarray):
+    """
+    Pack ragged citation histories into the zero-padded matrix used by score_batch
+
+    Parameters:
+    ----------
+    c_list: list[list[int]]
+        Citation history for all papers
+
+    Returns:
+    ----------
+    (np.ndarray, np.ndarray):
+        C-contiguous int32 matrix of shape (P, Tmax) and the history length of each paper
+    """
+
+    lengths = np.fromiter((len(c) for c in c_list), dtype=np.int64, count=len(c_list))
+    Tmax = int(lengths.max()) if len(c_list) else 0
+    C = np.zeros((len(c_list), Tmax), dtype=np.int32, order='C')
+    for p, c in enumerate(c_list):
+        C[p, :len(c)] = c
+    assert C.flags['C_CONTIGUOUS'] #row-wise reductions rely on C order; DataFrame round-trips can silently flip to F order
+    return C, lengths
+
+
+@njit(cache=True)
+def _gini_weighted(c_arr:np.ndarray) -> int:
+    """
+    Weighted citation sum for the Adjusted Gini Coefficient
+    """
+    n = c_arr.size
+    s = 0
+    for t in range(n):
+        s += c_arr[t]*(n - t)
+    return s
+
+
+_gini_scorers = dict() #one compiled scorer per history length
+
+
+def make_gini_scorer(n:int):
+    """
+    Build an Adjusted Gini Coefficient scorer specialized for histories of length n
+
+    With n captured as a compile-time constant, numba can fully unroll
+    the loop and bake the n/(n-1) factor in, so tight loops over
+    same-length histories call a direct specialized kernel instead of
+    the generic path. Compiled scorers are cached per length.
+
+    Parameters:
+    ----------
+    n: int
+        Length of the citation histories the scorer accepts
+
+    Returns:
+    ----------
+    Callable:
+        Function mapping an int64 array of length n to the score
+    """
+
+    if n in _gini_scorers:
+        return _gini_scorers[n]
+
+    factor = n/(n-1) if n > 1 else 0.0
+
+    @njit(fastmath=True)
+    def scorer(c_arr):
+        C = 0
+        weighted = 0
+        for t in range(n):
+            ct = c_arr[t]
+            C += ct
+            weighted += ct*(n - t)
+        if C == 0:
+            return 1.0
+        if n < 2:
+            return 0.0
+        return factor*(1 - (2*weighted - C)/(n*C))
+
+    _gini_scorers[n] = scorer
+    return scorer
+
+
+@njit(cache=True, fastmath=True)
+def _beauty_kernel(c_arr:np.ndarray) -> float:
+    """
+    Sum of the per-year Beauty Coefficient terms up to the citation peak
+    """
+    c0 = c_arr[0]
+    tm = np.argmax(c_arr)
+    ctm = c_arr[tm]
+    if tm == 0:
+        return 0.0
+    s = 0.0
+    for t in range(tm+1):
+        ct = c_arr[t]
+        m = ct if ct > 1 else 1
+        s += ((ctm - c0)*t/tm + c0 - ct)/m
+    return s
+
+
+@njit(cache=True, fastmath=True)
+def _kvalue_kernel(c20:np.ndarray) -> float:
+    """
+    K Value over the first 21 years of a citation history
+    """
+    s0 = 0
+    s1 = 0
+    for i in range(c20.size):
+        ct = c20[i]
+        s0 += ct
+        s1 += i*i*ct
+    if s0 == 0:
+        return 0.0
+    return np.sqrt(s1/s0)/20
+
+
+class CitationHistory:
+    """
+    Precomputed view of a single citation history
+
+    Computes the array form, citation total, cumulative sum and citation
+    peak once, so that scoring several metrics on the same paper does not
+    repeat the same O(n) reductions per metric. Every score/extract method
+    accepts a CitationHistory in place of the raw list.
+    """
+
+    def __init__(self, c:list[int]):
+        """
+        Parameters:
+        ----------
+        c : list
+            Citation history, c[0] is the citation of publication year.
+        """
+        self.arr = np.ascontiguousarray(c, dtype=np.int64)
+        self.total = int(self.arr.sum())
+        self.cumsum = np.cumsum(self.arr)
+        self.tm = int(self.arr.argmax()) if self.arr.size else 0
+        self.ctm = int(self.arr[self.tm]) if self.arr.size else 0
+
+    def __len__(self) -> int:
+        return self.arr.size
+
+    def __getitem__(self, key):
+        return self.arr[key]
+
+
+class AdjustedGiniCoefficient:
     """
     Based on Li, J., Shi, D., Zhao, S. X., & Fred, Y. Y. (2014). A study of the “heartbeat spectra” for “sleeping beauties”. Journal of informetrics, 8(3), 493-502.
     """
@@ -26,16 +188,47 @@ class AdjustedGiniCoefficient:
         """
 
 
-        C = sum(c)
-        n = len(c)
+        if isinstance(c, CitationHistory):
+            arr, C = c.arr, c.total
+        else:
+            arr = np.asarray(c, dtype=np.int64)
+            C = int(arr.sum())
+        n = arr.size
         if C==0:
             return 1.0
         elif n<2:
             return 0.0
         else:
-            Gs = (n/(n-1))*(1 - ((2*sum([c[t]*(n-t) for t in range(n)])-C)/(n*C)))
+            weighted = int(_gini_weighted(arr))
+            Gs = (n/(n-1))*(1 - ((2*weighted-C)/(n*C)))
             return Gs
 
+    @staticmethod
+    def score_batch(C:np.ndarray, lengths:np.ndarray) -> np.ndarray:
+        """
+        Parameters:
+        ----------
+        C : np.ndarray
+            Zero-padded citation histories of shape (P, Tmax), C[p,0] is the citation of publication year.
+        lengths : np.ndarray
+            History length of each paper, shape (P,).
+
+        Returns:
+        ----------
+        np.ndarray:
+            Score of Adjusted Gini Coefficient for each paper
+        """
+
+        C = np.asarray(C, dtype=np.int64)
+        n = np.asarray(lengths, dtype=np.int64)
+        t = _arange(C.shape[1])
+        W = np.where(t < n[:,None], n[:,None] - t, 0)
+        Csum = C.sum(axis=1)
+        weighted = (C*W).sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            Gs = (n/(n-1))*(1 - (2*weighted - Csum)/(n*Csum))
+        return np.where(Csum==0, 1.0, np.where(n<2, 0.0, Gs))
+
 
 class Average:
     """
@@ -64,9 +257,11 @@ class Average:
             whether the paper is hibernator or not
         """
 
-        c_average = sum(c[:s+1])/(s+1)
+        sleep_sum = sum(c[:s+1])
+        if sleep_sum > cs*(s+1): #sleep average above cs; skip scanning the awake window
+            return False
         ca_average = sum(c[s+1:s+a+1])/(a)
-        if (c_average<=cs) and (ca_average >= ca):
+        if ca_average >= ca:
             return True
         return False
 
@@ -90,29 +285,40 @@ class BeautyCoefficient:
             Score of Beauty Coefficient
         """
 
-        def _get_c0_tm_ctm(c:list[int]) -> (int,int,int):
-            """
-            Get parameters for calculating Beauty Coefficient
-            """
-            c0 = c[0]
-            tm = np.argmax(c)
-            ctm = np.max(c)
-            return c0,tm,ctm
+        if isinstance(c, CitationHistory):
+            c_arr, total = c.arr, c.total
+        else:
+            c_arr = np.ascontiguousarray(c, dtype=np.int64)
+            total = c_arr.sum()
+        if total == 0:
+            return 0
+        return _beauty_kernel(c_arr)
+
+    @staticmethod
+    def score_batch(C:np.ndarray, lengths:np.ndarray) -> np.ndarray:
+        """
+        Parameters:
+        ----------
+        C : np.ndarray
+            Zero-padded citation histories of shape (P, Tmax), C[p,0] is the citation of publication year.
+        lengths : np.ndarray
+            History length of each paper, shape (P,).
 
-        def _calcB(ctm:int, c0:int, tm:int, ct:int, max_ct:int, t:int) -> float:
-            '''
-            Calculate Beauty Coefficient
-            '''
-            return ((ctm - c0)*t/tm + c0 - ct)/max_ct
+        Returns:
+        ----------
+        np.ndarray:
+            Score of Beauty Coefficient for each paper
+        """
 
-        if np.sum(c) == 0:
-            return 0
-        else:
-            c0,tm,ctm = _get_c0_tm_ctm(c)
-            if tm == 0:
-                return 0
-            else:
-                return sum([_calcB(ctm,c0,tm,c[t],max(1,c[t]),t) for t in range(tm+1)])
+        C = np.asarray(C, dtype=np.int64)
+        t = _arange(C.shape[1])
+        total = C.sum(axis=1)
+        tm = C.argmax(axis=1)
+        ctm = C[np.arange(C.shape[0]), tm]
+        c0 = C[:,0]
+        vals = ((ctm - c0)[:,None]*t/np.maximum(tm, 1)[:,None] + c0[:,None] - C)/np.maximum(C, 1)
+        B = np.where(t <= tm[:,None], vals, 0.0).sum(axis=1)
+        return np.where((total==0)|(tm==0), 0.0, B)
 
 
 class BeautyCoefficientCumulativePercentage:
@@ -134,27 +340,47 @@ class BeautyCoefficientCumulativePercentage:
             Score of Beauty Coefficient Cumulative Percentage
         """
 
-        def _get_c0_tm_ctm(c:list[int]) -> (int,int,int):
-            """
-            Get parameters for calculating Beauty Coefficient
-            """
-            c0 = c[0]
-            tm = np.argmax(c)
-            ctm = np.max(c)
-            return c0,tm,ctm
+        if isinstance(c, CitationHistory):
+            total, cs = c.total, c.cumsum
+        else:
+            arr = np.asarray(c, dtype=np.float64)
+            total = arr.sum()
+            cs = np.cumsum(arr)
+        if total == 0:
+            return 0
+        c_relative = cs/total
+        c0 = c_relative[0]
+        tm = int(c_relative.argmax())
+        if tm == 0:
+            return 0.0
+        t = _arange(tm+1)
+        return float(((1 - c0)*t/tm + c0 - c_relative[:tm+1]).sum())
 
-        def _calcBcp(ctm:int, c0:int, tm:int, ct:int, t:int) -> float:
-            '''
-            Calculate Beauty Coefficient Cumulative Percentage
-            '''
-            return (1 - c0)*t/tm + c0 - ct
+    @staticmethod
+    def score_batch(C:np.ndarray, lengths:np.ndarray) -> np.ndarray:
+        """
+        Parameters:
+        ----------
+        C : np.ndarray
+            Zero-padded citation histories of shape (P, Tmax), C[p,0] is the citation of publication year.
+        lengths : np.ndarray
+            History length of each paper, shape (P,).
 
-        if np.sum(c) == 0:
-            return 0
-        else:
-            c_relative = np.cumsum(c)/np.sum(c)
-            c0,tm,ctm = _get_c0_tm_ctm(c_relative)
-            return sum([_calcBcp(ctm,c0,tm,c_relative[t],t) for t in range(tm+1)])
+        Returns:
+        ----------
+        np.ndarray:
+            Score of Beauty Coefficient Cumulative Percentage for each paper
+        """
+
+        C = np.asarray(C, dtype=np.float64)
+        t = _arange(C.shape[1])
+        total = C.sum(axis=1)
+        rel = np.cumsum(C, axis=1)/np.where(total==0, 1.0, total)[:,None]
+        tm = rel.argmax(axis=1)
+        c0 = rel[:,0]
+        vals = (1 - c0)[:,None]*t/np.maximum(tm, 1)[:,None] + c0[:,None] - rel
+        Bcp = np.where(t <= tm[:,None], vals, 0.0).sum(axis=1)
+        return np.where(total==0, 0.0, Bcp)
 
 
 class CitationAngle:
@@ -192,14 +418,52 @@ class CitationAngle:
         if len(c)<=10: #As original, papers have to sleep at least 5 years which requires 10 years after submission.
             return False
         else:
+            c_arr = c.arr if isinstance(c, CitationHistory) else np.asarray(c)
             th = int(len(c)/2)
-            t1 = np.argmax(c[:th])
-            ac1 = np.average(c[:th])
-            t2 = th + np.argmax(c[th:])
-            peak2 = np.max(c[th:])
+            t1 = int(c_arr[:th].argmax())
+            ac1 = c_arr[:th].mean()
+            t2 = th + int(c_arr[th:].argmax())
+            peak2 = c_arr[t2]
             angle2 = np.degrees(np.arctan(peak2/t2))
             return (peak2>c_peak) & (angle2>angle_after) & (ac1<=c_before_average) & (t2-t1>=span)
 
+    @staticmethod
+    def extract_batch(C:np.ndarray, lengths:np.ndarray, c_before_average:float, c_peak:float, angle_after:float, span:float) -> np.ndarray:
+        """
+        Parameters:
+        ----------
+        C : np.ndarray
+            Zero-padded citation histories of shape (P, Tmax), C[p,0] is the citation of publication year.
+        lengths : np.ndarray
+            History length of each paper, shape (P,).
+        c_before_average: float
+            threshold for determining average citation before half years as low
+        c_peak: float
+            threshold for determining peak citation as high
+        angle_after: float
+            threshold for citation angle
+        span: float
+            threshold for span between peak year before half years and peak year after half years
+
+        Returns:
+        ----------
+        np.ndarray:
+            whether each paper is hibernator or not
+        """
+
+        C = np.asarray(C, dtype=np.float64)
+        n = np.asarray(lengths, dtype=np.int64)
+        t = _arange(C.shape[1])
+        th = n//2
+        m1 = t < th[:,None]
+        m2 = (t >= th[:,None]) & (t < n[:,None])
+        t1 = np.where(m1, C, -1.0).argmax(axis=1)
+        ac1 = (C*m1).sum(axis=1)/np.where(th > 0, th, 1)
+        t2 = np.where(m2, C, -1.0).argmax(axis=1)
+        peak2 = C[np.arange(C.shape[0]), t2]
+        angle2 = np.degrees(np.arctan(peak2/np.where(t2 > 0, t2, 1)))
+        return (n > 10) & (peak2>c_peak) & (angle2>angle_after) & (ac1<=c_before_average) & (t2-t1>=span)
+
 
 class CitationDelay:
     """
@@ -219,7 +483,37 @@ class CitationDelay:
         float:
             Score of Citation Delay
         """
-        return 1 - np.sum((np.cumsum(c)/np.sum(c))[:-1])/(len(c)-1)
+        if isinstance(c, CitationHistory):
+            total, cs = c.total, c.cumsum
+        else:
+            arr = np.asarray(c, dtype=np.float64)
+            total = arr.sum()
+            cs = np.cumsum(arr)
+        return 1 - (cs[:-1]/total).sum()/(len(cs)-1)
+
+    @staticmethod
+    def score_batch(C:np.ndarray, lengths:np.ndarray) -> np.ndarray:
+        """
+        Parameters:
+        ----------
+        C : np.ndarray
+            Zero-padded citation histories of shape (P, Tmax), C[p,0] is the citation of publication year.
+        lengths : np.ndarray
+            History length of each paper, shape (P,).
+
+        Returns:
+        ----------
+        np.ndarray:
+            Score of Citation Delay for each paper
+        """
+
+        C = np.asarray(C, dtype=np.float64)
+        n = np.asarray(lengths, dtype=np.int64)
+        t = _arange(C.shape[1])
+        total = C.sum(axis=1)
+        cs = np.cumsum(C, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return 1 - (np.where(t < (n-1)[:,None], cs, 0.0)/total[:,None]).sum(axis=1)/(n-1)
 
 
 class DNIC:
@@ -246,19 +540,44 @@ class DNIC:
         dict:
             Average citation of each subject and year
         """
+        subj_ids = {subj:i for i,subj in enumerate(sorted(set().union(*subjs_list)))}
+        years = sorted(set(year_list))
+        year_ids = {y:j for j,y in enumerate(years)}
+
+        n_subj = len(subj_ids)
+        n_year = len(years)
+
+        flat_idx = []
+        flat_val = []
+        for c, subjs, year in zip(c_list, subjs_list, year_list):
+            ids = [subj_ids[subj] for subj in subjs]
+            for y in years:
+                t = y - year
+                if t < 0:
+                    continue
+                if t >= len(c):
+                    break
+                cit = c[t]
+                j = year_ids[y]
+                for i in ids:
+                    flat_idx.append(i*n_year + j)
+                    flat_val.append(cit)
+
+        flat_idx = np.asarray(flat_idx, dtype=np.int64)
+        flat_val = np.asarray(flat_val, dtype=np.float64)
+        acc_sum = np.bincount(flat_idx, weights=flat_val, minlength=n_subj*n_year).reshape(n_subj, n_year)
+        acc_cited = np.bincount(flat_idx, weights=(flat_val>=1), minlength=n_subj*n_year).reshape(n_subj, n_year)
+        acc_papers = np.bincount(flat_idx, minlength=n_subj*n_year).reshape(n_subj, n_year) #target-paper counts decide which keys exist
+
         ekj_dic = dict()
-        df = pd.DataFrame([c_list,subjs_list,year_list],index=['c','subjs','year']).T
-
-        for year in set(year_list):
-            for subj in set(list(itertools.chain.from_iterable(subjs_list))):
-                targets = df[(df['year']<=year)&(df['subjs'].map(lambda x: subj in x))]
-                if len(targets):
-                    citations_kj = targets.apply(lambda row: row['c'][year-row['year']],axis=1)
-                    N_kj = (citations_kj>=1).sum()
+        for subj, i in subj_ids.items():
+            for y, j in year_ids.items():
+                if acc_papers[i,j]:
+                    N_kj = acc_cited[i,j]
                     if N_kj == 0:
-                        ekj_dic[(subj,year)] = -1
+                        ekj_dic[(subj,y)] = -1
                     else:
-                        ekj_dic[(subj,year)] = citations_kj.sum()/N_kj
+                        ekj_dic[(subj,y)] = acc_sum[i,j]/N_kj
         return ekj_dic
 
     @staticmethod
@@ -284,14 +603,21 @@ class DNIC:
         bool:
             whether the paper is hibernator or not
         """
+        if isinstance(c, CitationHistory):
+            c_arr, t_peak_v = c.arr, c.tm
+        else:
+            c_arr = np.asarray(c)
+            t_peak_v = int(c_arr.argmax())
         t_h = int(len(c)/2)
-        t_peak_v = np.argmax(c) 
         y_peak_v = year + t_peak_v
-        c_peak_v = c[t_peak_v]
+        c_peak_v = c_arr[t_peak_v]
         if t_h < t_peak_v:
+            n_before = y_peak_v - 2 - year
+            c_before = c_arr[:n_before].astype(np.float64)
             for subj in subjs: #at least 1 subject meet a requirement, the paper is regarded as hibernator
                 if c_peak_v/ekj_dic[(subj,y_peak_v)] > c_peak:
-                    if max([c[i-year]/ekj_dic[(subj,i)] for i in range(year,y_peak_v-2)]) < c_before_peak:
+                    ekj_row = np.fromiter((ekj_dic[(subj,i)] for i in range(year,y_peak_v-2)), dtype=np.float64, count=n_before)
+                    if (c_before/ekj_row).max() < c_before_peak:
                         return True
         return False
 
@@ -319,11 +645,12 @@ class ExponentialQuartile:
             whether the paper is hibernator or not
         """
 
+        c_arr = c.arr if isinstance(c, CitationHistory) else np.asarray(c)
         n = len(c)
         nw = int(n * 0.2)
         ns = n - nw
-        cs = np.max(c[:ns])
-        cw = np.max(c[ns:])
+        cs = c_arr[:ns].max()
+        cw = c_arr[ns:].max()
         return (cw > 4*cs) & (cw>(np.sqrt(k*ns)))
 
 
@@ -346,11 +673,35 @@ class KValue:
             Score of K Value
         """
         
-        c20 = c[:21]
-        if sum(c20) == 0:
-            return 0.0
-        K =  np.sqrt(sum([i**2 * ct for i,ct in enumerate(c20)])/sum(c20)) / 20
-        return K
+        arr = c.arr if isinstance(c, CitationHistory) else c
+        c20 = np.zeros(21, dtype=np.int64) #fixed-shape buffer so the kernel compiles one fully unrollable specialization
+        m = min(21, len(arr))
+        c20[:m] = arr[:m]
+        return _kvalue_kernel(c20)
+
+    @staticmethod
+    def score_batch(C:np.ndarray, lengths:np.ndarray) -> np.ndarray:
+        """
+        Parameters:
+        ----------
+        C : np.ndarray
+            Zero-padded citation histories of shape (P, Tmax), C[p,0] is the citation of publication year.
+        lengths : np.ndarray
+            History length of each paper, shape (P,).
+
+        Returns:
+        ----------
+        np.ndarray:
+            Score of K Value for each paper
+        """
+
+        c20 = np.asarray(C, dtype=np.int64)[:, :21]
+        i = _arange(c20.shape[1])
+        s0 = c20.sum(axis=1)
+        s1 = (i*i*c20).sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            K = np.sqrt(s1/s0)/20
+        return np.where(s0==0, 0.0, K)
 
 
 class Naive:
@@ -378,8 +729,12 @@ class Naive:
             whether the paper is hibernator or not
         """
         
-        c_sum = sum(c[:s+1])
-        c_now = sum(c)
+        if isinstance(c, CitationHistory):
+            arr, c_now = c.arr, c.total
+        else:
+            arr = np.asarray(c, dtype=np.int64)
+            c_now = int(arr.sum())
+        c_sum = int(arr[:s+1].sum())
         if (c_sum<=cs) and (c_now >= ca):
             return True
         return False
@@ -405,13 +760,15 @@ class Quartile:
         int:
             Year which the paper reach the half number of its current citation
         """
-        if np.sum(c)  == 0:
+        if isinstance(c, CitationHistory):
+            total, cs = c.total, c.cumsum
+        else:
+            arr = np.asarray(c)
+            total = arr.sum()
+            cs = np.cumsum(arr)
+        if total == 0:
             return 0
-        try:
-            return np.min(np.where(np.cumsum(c)/np.sum(c) >= 0.5))
-        except:
-            print(c)
-            raise
+        return int(np.searchsorted(cs, 0.5*total, side='left'))
 
     @staticmethod
     def get_c_dic(c50_list:list[int], subjs_list: list[list[str]], year_list:list[int], rate:float) -> dict:
@@ -435,14 +792,17 @@ class Quartile:
             Year which (rate)% of papers in each subject and year obtain the half number of its current citation
         """
 
-        c_dic = dict()
-        df = pd.DataFrame([c50_list,subjs_list,year_list],index=['c50','subjs','year']).T
+        groups = defaultdict(list)
+        for c50, subjs, year in zip(c50_list, subjs_list, year_list):
+            for subj in subjs:
+                groups[(subj,year)].append(c50)
 
-        for year in set(df['year']):
-            for subj in set(list(itertools.chain.from_iterable(df['subjs']))):
-                targets = df[(df['year']==year)&(df['subjs'].map(lambda x: subj in x))]
-                if len(targets):
-                    c_dic[(subj,year)] = targets.sort_values('c50').iloc[int(len(targets)*rate)]['c50']
+        c_dic = dict()
+        for key, vals in groups.items():
+            k = int(len(vals)*rate)
+            vals_arr = np.asarray(vals)
+            vals_arr.partition(k)
+            c_dic[key] = vals_arr[k]
         return c_dic
 
     @staticmethod
@@ -467,6 +827,7 @@ class Quartile:
             whether the paper is hibernator or not
         """
 
-        scores = [1 if c50 < c_dic_before[(subj,year)] else 3 if c50 > c_dic_after[(subj,year)] else 2 for subj in subjs]
-            
-        return np.mean(scores) >= 2.5
\ No newline at end of file
+        before = np.fromiter((c_dic_before[(subj,year)] for subj in subjs), dtype=np.int64, count=len(subjs))
+        after = np.fromiter((c_dic_after[(subj,year)] for subj in subjs), dtype=np.int64, count=len(subjs))
+        scores = 2 + (c50 > after).astype(np.int8) - (c50 < before).astype(np.int8)
+        return scores.mean() >= 2.5
\ No newline at end of file